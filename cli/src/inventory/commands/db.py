@@ -17,7 +17,7 @@ from rich.table import Table
 from inventory.config import get_settings
 from inventory.db.connection import get_connection
 
-app = typer.Typer(help="Database operations")
+app = typer.Typer(add_completion=False)
 console = Console()
 
 # Container configuration
@@ -9,8 +9,9 @@ from rich.console import Console
 from rich.table import Table
 
 from inventory.db.connection import get_connection
+from inventory.db.repositories import DeviceRepository
 
-app = typer.Typer(help="Device management")
+app = typer.Typer(add_completion=False)
 console = Console()
 
 
@@ -207,9 +208,7 @@ def create(
     mac: Optional[str] = typer.Option(None, "--mac", help="MAC address"),
 ):
     """Create a new device."""
-    import re
-
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    slug = DeviceRepository.generate_slug(name)
 
     with get_connection() as conn:
         with conn.cursor() as cur:
@@ -7,8 +7,9 @@ from rich.console import Console
 from rich.table import Table
 
 from inventory.db.connection import get_connection
+from inventory.db.repositories import NetworkRepository
 
-app = typer.Typer(help="Network management")
+app = typer.Typer(add_completion=False)
 console = Console()
 
 
@@ -247,9 +248,7 @@ def create(
     primary: bool = typer.Option(False, "--primary", "-p", help="Set as primary network"),
 ):
     """Create a new network."""
-    import re
-
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    slug = NetworkRepository.generate_slug(name)
 
     with get_connection() as conn:
         with conn.cursor() as cur:
@@ -7,22 +7,16 @@ from rich.console import Console
 from rich.table import Table
 
 from inventory.db.connection import get_connection
+from inventory.db.repositories import OrganizationRepository
 
-app = typer.Typer(help="Organization management")
+app = typer.Typer(add_completion=False)
 console = Console()
 
 
 @app.command("list")
 def list_orgs():
     """List all organizations."""
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT id, name, slug, type, is_active, created_at
-                FROM organizations
-                ORDER BY name
-            """)
-            rows = cur.fetchall()
+    rows = OrganizationRepository().list_raw(limit=None)
 
     if not rows:
         console.print("[yellow]No organizations found[/yellow]")
@@ -91,10 +85,8 @@ def create(
     description: str = typer.Option(None, "--description", "-d", help="Description"),
 ):
     """Create a new organization."""
-    import re
-
     # Generate slug from name
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    slug = OrganizationRepository.generate_slug(name)
 
     with get_connection() as conn:
         with conn.cursor() as cur:
@@ -7,8 +7,9 @@ from rich.console import Console
 from rich.table import Table
 
 from inventory.db.connection import get_connection
+from inventory.db.repositories import SiteRepository
 
-app = typer.Typer(help="Site management")
+app = typer.Typer(add_completion=False)
 console = Console()
 
 
@@ -17,27 +18,7 @@ def list_sites(
     org: str = typer.Option(None, "--org", "-o", help="Filter by organization slug"),
 ):
     """List all sites."""
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            if org:
-                cur.execute(
-                    """
-                    SELECT s.*, o.name as org_name, o.slug as org_slug
-                    FROM sites s
-                    JOIN organizations o ON s.organization_id = o.id
-                    WHERE o.slug = %s
-                    ORDER BY s.name
-                """,
-                    (org,),
-                )
-            else:
-                cur.execute("""
-                    SELECT s.*, o.name as org_name, o.slug as org_slug
-                    FROM sites s
-                    JOIN organizations o ON s.organization_id = o.id
-                    ORDER BY o.name, s.name
-                """)
-            rows = cur.fetchall()
+    rows = SiteRepository().list_by_organization(org)
 
     if not rows:
         console.print("[yellow]No sites found[/yellow]")
@@ -67,41 +48,11 @@ def list_sites(
 @app.command()
 def show(slug: str = typer.Argument(..., help="Site slug")):
     """Show site details."""
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT s.*, o.name as org_name
-                FROM sites s
-                JOIN organizations o ON s.organization_id = o.id
-                WHERE s.slug = %s
-            """,
-                (slug,),
-            )
-            site = cur.fetchone()
-
-            if not site:
-                console.print(f"[red]Site not found:[/red] {slug}")
-                raise typer.Exit(1)
+    site = SiteRepository().get_with_counts(slug)
 
-            # Get counts
-            cur.execute(
-                "SELECT COUNT(*) as count FROM zones WHERE site_id = %s",
-                (site["id"],),
-            )
-            zone_count = cur.fetchone()["count"]
-
-            cur.execute(
-                "SELECT COUNT(*) as count FROM networks WHERE site_id = %s",
-                (site["id"],),
-            )
-            network_count = cur.fetchone()["count"]
-
-            cur.execute(
-                "SELECT COUNT(*) as count FROM devices WHERE site_id = %s",
-                (site["id"],),
-            )
-            device_count = cur.fetchone()["count"]
+    if not site:
+        console.print(f"[red]Site not found:[/red] {slug}")
+        raise typer.Exit(1)
 
     console.print(f"\n[bold]{site['name']}[/bold]")
     console.print(f"  Slug: {site['slug']}")
@@ -120,9 +71,9 @@ def show(slug: str = typer.Argument(..., help="Site slug")):
         address = ", ".join(filter(None, address_parts))
         console.print(f"  Address: {address}")
 
-    console.print(f"\n  Zones: {zone_count}")
-    console.print(f"  Networks: {network_count}")
-    console.print(f"  Devices: {device_count}")
+    console.print(f"\n  Zones: {site['zone_count']}")
+    console.print(f"  Networks: {site['network_count']}")
+    console.print(f"  Devices: {site['device_count']}")
 
 
 @app.command()
@@ -137,9 +88,7 @@ def create(
     primary: bool = typer.Option(False, "--primary", "-p", help="Set as primary site"),
 ):
     """Create a new site."""
-    import re
-
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    slug = SiteRepository.generate_slug(name)
 
     with get_connection() as conn:
         with conn.cursor() as cur:
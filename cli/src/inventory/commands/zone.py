@@ -7,8 +7,9 @@ from rich.console import Console
 from rich.table import Table
 
 from inventory.db.connection import get_connection
+from inventory.db.repositories import ZoneRepository
 
-app = typer.Typer(help="Zone management")
+app = typer.Typer(add_completion=False)
 console = Console()
 
 
@@ -77,40 +78,11 @@ def list_zones(
 @app.command()
 def show(slug: str = typer.Argument(..., help="Zone slug")):
     """Show zone details."""
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT
-                    z.*,
-                    s.name as site_name,
-                    p.name as parent_name
-                FROM zones z
-                JOIN sites s ON z.site_id = s.id
-                LEFT JOIN zones p ON z.parent_zone_id = p.id
-                WHERE z.slug = %s
-            """,
-                (slug,),
-            )
-            zone = cur.fetchone()
+    zone = ZoneRepository().get_with_details(slug)
 
-            if not zone:
-                console.print(f"[red]Zone not found:[/red] {slug}")
-                raise typer.Exit(1)
-
-            # Get device count
-            cur.execute(
-                "SELECT COUNT(*) as count FROM devices WHERE zone_id = %s",
-                (zone["id"],),
-            )
-            device_count = cur.fetchone()["count"]
-
-            # Get child zones
-            cur.execute(
-                "SELECT name, slug FROM zones WHERE parent_zone_id = %s ORDER BY sort_order, name",
-                (zone["id"],),
-            )
-            child_zones = cur.fetchall()
+    if not zone:
+        console.print(f"[red]Zone not found:[/red] {slug}")
+        raise typer.Exit(1)
 
     console.print(f"\n[bold]{zone['name']}[/bold]")
     console.print(f"  Slug: {zone['slug']}")
@@ -124,11 +96,11 @@ def show(slug: str = typer.Argument(..., help="Zone slug")):
     if zone["area_sqft"]:
         console.print(f"  Area: {zone['area_sqft']} sq ft")
 
-    console.print(f"\n  Devices: {device_count}")
+    console.print(f"\n  Devices: {zone['device_count']}")
 
-    if child_zones:
-        console.print(f"\n[bold]Child Zones ({len(child_zones)})[/bold]")
-        for child in child_zones:
+    if zone["child_zones"]:
+        console.print(f"\n[bold]Child Zones ({len(zone['child_zones'])})[/bold]")
+        for child in zone["child_zones"]:
             console.print(f"  - {child['name']} ({child['slug']})")
 
 
@@ -143,9 +115,7 @@ def create(
     floor: int = typer.Option(None, "--floor", "-f", help="Floor number"),
 ):
     """Create a new zone."""
-    import re
-
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    slug = ZoneRepository.generate_slug(name)
 
     with get_connection() as conn:
         with conn.cursor() as cur:
@@ -2,10 +2,11 @@
 Device repository.
 """
 
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from uuid import UUID
 
-from inventory.db.connection import get_connection
+from psycopg.rows import tuple_row
+
 from inventory.db.repository import BaseRepository
 from inventory.models.device import Device, DeviceCreate, DeviceUpdate
 
@@ -28,65 +29,63 @@ class DeviceRepository(BaseRepository[Device, DeviceCreate, DeviceUpdate]):
         category_slug: Optional[str] = None,
         status: Optional[str] = None,
         limit: int = 50,
-    ) -> list[dict]:
+    ) -> Iterator[dict]:
         """List devices with site, zone, and category info."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                query = """
-                    SELECT
-                        d.*, s.name as site_name, s.slug as site_slug,
-                        z.name as zone_name, n.name as network_name,
-                        c.name as category_name
-                    FROM devices d
-                    JOIN sites s ON d.site_id = s.id
-                    LEFT JOIN zones z ON d.zone_id = z.id
-                    LEFT JOIN networks n ON d.network_id = n.id
-                    LEFT JOIN device_categories c ON d.category_id = c.id
-                    WHERE d.is_active = TRUE
-                """
-                params: list[Any] = []
-
-                if site_slug:
-                    query += " AND s.slug = %s"
-                    params.append(site_slug)
-
-                if zone_slug:
-                    query += " AND z.slug = %s"
-                    params.append(zone_slug)
-
-                if category_slug:
-                    query += " AND c.slug = %s"
-                    params.append(category_slug)
-
-                if status:
-                    query += " AND d.status = %s"
-                    params.append(status)
-
-                query += " ORDER BY d.name LIMIT %s"
-                params.append(limit)
-
-                cur.execute(query, params)
-                return cur.fetchall()
+        query = """
+            SELECT
+                d.*, s.name as site_name, s.slug as site_slug,
+                z.name as zone_name, n.name as network_name,
+                c.name as category_name
+            FROM devices d
+            JOIN sites s ON d.site_id = s.id
+            LEFT JOIN zones z ON d.zone_id = z.id
+            LEFT JOIN networks n ON d.network_id = n.id
+            LEFT JOIN device_categories c ON d.category_id = c.id
+            WHERE d.is_active = TRUE
+        """
+        params: list[Any] = []
+
+        if site_slug:
+            query += " AND s.slug = %s"
+            params.append(site_slug)
+
+        if zone_slug:
+            query += " AND z.slug = %s"
+            params.append(zone_slug)
+
+        if category_slug:
+            query += " AND c.slug = %s"
+            params.append(category_slug)
+
+        if status:
+            query += " AND d.status = %s"
+            params.append(status)
+
+        query += " ORDER BY d.name LIMIT %s"
+        params.append(limit)
+
+        with self._cursor("stream_devices") as (conn, cur):
+            cur.execute(query, params)
+            yield from cur
 
     def get_with_details(self, slug: str) -> Optional[dict]:
         """Get device with all related info."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT
-                        d.*, s.name as site_name, z.name as zone_name,
-                        n.name as network_name, c.name as category_name
-                    FROM devices d
-                    JOIN sites s ON d.site_id = s.id
-                    LEFT JOIN zones z ON d.zone_id = z.id
-                    LEFT JOIN networks n ON d.network_id = n.id
-                    LEFT JOIN device_categories c ON d.category_id = c.id
-                    WHERE d.slug = %s
-                    """,
-                    (slug,),
-                )
-                return cur.fetchone()
+        with self._cursor() as (conn, cur):
+            cur.execute(
+                """
+                SELECT
+                    d.*, s.name as site_name, z.name as zone_name,
+                    n.name as network_name, c.name as category_name
+                FROM devices d
+                JOIN sites s ON d.site_id = s.id
+                LEFT JOIN zones z ON d.zone_id = z.id
+                LEFT JOIN networks n ON d.network_id = n.id
+                LEFT JOIN device_categories c ON d.category_id = c.id
+                WHERE d.slug = %s
+                """,
+                (slug,),
+            )
+            return cur.fetchone()
 
     def count_by_group(
         self, group_by: str = "category", site_slug: Optional[str] = None
@@ -99,55 +98,51 @@ class DeviceRepository(BaseRepository[Device, DeviceCreate, DeviceUpdate]):
             "status": "d.status",
         }.get(group_by, "c.name")
 
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                query = f"""
-                    SELECT
-                        COALESCE({group_column}, 'Unassigned') as group_name,
-                        COUNT(*) as count
-                    FROM devices d
-                    JOIN sites s ON d.site_id = s.id
-                    LEFT JOIN zones z ON d.zone_id = z.id
-                    LEFT JOIN device_categories c ON d.category_id = c.id
-                    WHERE d.is_active = TRUE
-                """
-                params: list[Any] = []
+        with self._cursor() as (conn, cur):
+            query = f"""
+                SELECT
+                    COALESCE({group_column}, 'Unassigned') as group_name,
+                    COUNT(*) as count
+                FROM devices d
+                JOIN sites s ON d.site_id = s.id
+                LEFT JOIN zones z ON d.zone_id = z.id
+                LEFT JOIN device_categories c ON d.category_id = c.id
+                WHERE d.is_active = TRUE
+            """
+            params: list[Any] = []
 
-                if site_slug:
-                    query += " AND s.slug = %s"
-                    params.append(site_slug)
+            if site_slug:
+                query += " AND s.slug = %s"
+                params.append(site_slug)
 
-                query += f" GROUP BY {group_column} ORDER BY count DESC"
+            query += f" GROUP BY {group_column} ORDER BY count DESC"
 
-                cur.execute(query, params)
-                return cur.fetchall()
+            cur.execute(query, params)
+            return cur.fetchall()
 
     def get_site_id(self, site_slug: str) -> Optional[UUID]:
         """Get site ID by slug."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("SELECT id FROM sites WHERE slug = %s", (site_slug,))
-                row = cur.fetchone()
-                return row["id"] if row else None
+        with self._cursor(row_factory=tuple_row) as (conn, cur):
+            cur.execute("SELECT id FROM sites WHERE slug = %s", (site_slug,))
+            row = cur.fetchone()
+            return row[0] if row else None
 
     def get_zone_id(self, zone_slug: str, site_id: UUID) -> Optional[UUID]:
         """Get zone ID by slug within a site."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT id FROM zones WHERE slug = %s AND site_id = %s",
-                    (zone_slug, site_id),
-                )
-                row = cur.fetchone()
-                return row["id"] if row else None
+        with self._cursor(row_factory=tuple_row) as (conn, cur):
+            cur.execute(
+                "SELECT id FROM zones WHERE slug = %s AND site_id = %s",
+                (zone_slug, site_id),
+            )
+            row = cur.fetchone()
+            return row[0] if row else None
 
     def get_category_id(self, category_slug: str) -> Optional[UUID]:
         """Get category ID by slug."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT id FROM device_categories WHERE slug = %s",
-                    (category_slug,),
-                )
-                row = cur.fetchone()
-                return row["id"] if row else None
+        with self._cursor(row_factory=tuple_row) as (conn, cur):
+            cur.execute(
+                "SELECT id FROM device_categories WHERE slug = %s",
+                (category_slug,),
+            )
+            row = cur.fetchone()
+            return row[0] if row else None
@@ -2,17 +2,19 @@
 Network repository.
 """
 
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from psycopg.rows import tuple_row
 
-from inventory.db.connection import get_connection
 from inventory.db.repository import BaseRepository
+from inventory.models.base import UpdateBase
 from inventory.models.network import Network, NetworkCreate
 
 
-class NetworkUpdate(BaseModel):
+@dataclass
+class NetworkUpdate(UpdateBase):
     """Fields for updating a network."""
 
     name: Optional[str] = None
@@ -39,100 +41,93 @@ class NetworkRepository(BaseRepository[Network, NetworkCreate, NetworkUpdate]):
         self,
         site_slug: Optional[str] = None,
         network_type: Optional[str] = None,
-    ) -> list[dict]:
+    ) -> Iterator[dict]:
         """List networks with site and device count."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                query = """
-                    SELECT
-                        n.*, s.name as site_name, s.slug as site_slug,
-                        (SELECT COUNT(*) FROM devices d WHERE d.network_id = n.id) as device_count
-                    FROM networks n
-                    JOIN sites s ON n.site_id = s.id
-                    WHERE n.is_active = TRUE
-                """
-                params: list[Any] = []
-
-                if site_slug:
-                    query += " AND s.slug = %s"
-                    params.append(site_slug)
-
-                if network_type:
-                    query += " AND n.network_type = %s"
-                    params.append(network_type)
-
-                query += " ORDER BY s.name, n.name"
-
-                cur.execute(query, params)
-                return cur.fetchall()
+        query = """
+            SELECT
+                n.*, s.name as site_name, s.slug as site_slug,
+                (SELECT COUNT(*) FROM devices d WHERE d.network_id = n.id) as device_count
+            FROM networks n
+            JOIN sites s ON n.site_id = s.id
+            WHERE n.is_active = TRUE
+        """
+        params: list[Any] = []
+
+        if site_slug:
+            query += " AND s.slug = %s"
+            params.append(site_slug)
+
+        if network_type:
+            query += " AND n.network_type = %s"
+            params.append(network_type)
+
+        query += " ORDER BY s.name, n.name"
+
+        with self._cursor("stream_networks") as (conn, cur):
+            cur.execute(query, params)
+            yield from cur
 
     def get_with_details(self, slug: str) -> Optional[dict]:
         """Get network with site and controller info."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
+        with self._cursor() as (conn, cur):
+            cur.execute(
+                """
+                SELECT
+                    n.*, s.name as site_name,
+                    d.name as controller_name
+                FROM networks n
+                JOIN sites s ON n.site_id = s.id
+                LEFT JOIN devices d ON n.controller_device_id = d.id
+                WHERE n.slug = %s
+                """,
+                (slug,),
+            )
+            network = cur.fetchone()
+
+            if network:
+                # Get device count
                 cur.execute(
-                    """
-                    SELECT
-                        n.*, s.name as site_name,
-                        d.name as controller_name
-                    FROM networks n
-                    JOIN sites s ON n.site_id = s.id
-                    LEFT JOIN devices d ON n.controller_device_id = d.id
-                    WHERE n.slug = %s
-                    """,
-                    (slug,),
+                    "SELECT COUNT(*) as count FROM devices WHERE network_id = %s",
+                    (network["id"],),
                 )
-                network = cur.fetchone()
-
-                if network:
-                    # Get device count
-                    cur.execute(
-                        "SELECT COUNT(*) as count FROM devices WHERE network_id = %s",
-                        (network["id"],),
-                    )
-                    network["device_count"] = cur.fetchone()["count"]
-
-                    # Get IP allocation count
-                    cur.execute(
-                        "SELECT COUNT(*) as count FROM ip_allocations WHERE network_id = %s",
-                        (network["id"],),
-                    )
-                    network["ip_count"] = cur.fetchone()["count"]
-
-                return network
-
-    def list_ip_allocations(self, network_slug: str) -> list[dict]:
-        """List IP allocations for a network."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                # Get network
+                network["device_count"] = cur.fetchone()["count"]
+
+                # Get IP allocation count
                 cur.execute(
-                    "SELECT id, cidr FROM networks WHERE slug = %s",
-                    (network_slug,),
+                    "SELECT COUNT(*) as count FROM ip_allocations WHERE network_id = %s",
+                    (network["id"],),
                 )
-                network = cur.fetchone()
+                network["ip_count"] = cur.fetchone()["count"]
 
-                if not network or not network["cidr"]:
-                    return []
+            return network
 
-                cur.execute(
-                    """
-                    SELECT
-                        ip.ip_address, ip.allocation_type, ip.hostname,
-                        ip.is_active, ip.last_seen, d.name as device_name
-                    FROM ip_allocations ip
-                    LEFT JOIN devices d ON ip.device_id = d.id
-                    WHERE ip.network_id = %s
-                    ORDER BY ip.ip_address
-                    """,
-                    (network["id"],),
+    def list_ip_allocations(self, network_slug: str) -> Iterator[dict]:
+        """List IP allocations for a network.
+
+        Yields nothing if the network does not exist or has no CIDR.
+        """
+        # Allocation tables can be large; stream them instead of fetchall()
+        with self._cursor("stream_ips") as (conn, cur):
+            cur.execute(
+                """
+                WITH n AS (
+                    SELECT id FROM networks WHERE slug = %s AND cidr IS NOT NULL
                 )
-                return cur.fetchall()
+                SELECT
+                    ip.ip_address, ip.allocation_type, ip.hostname,
+                    ip.is_active, ip.last_seen, d.name as device_name
+                FROM ip_allocations ip
+                JOIN n ON ip.network_id = n.id
+                LEFT JOIN devices d ON ip.device_id = d.id
+                ORDER BY ip.ip_address
+                """,
+                (network_slug,),
+            )
+            yield from cur
 
     def get_site_id(self, site_slug: str) -> Optional[UUID]:
         """Get site ID by slug."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("SELECT id FROM sites WHERE slug = %s", (site_slug,))
-                row = cur.fetchone()
-                return row["id"] if row else None
+        with self._cursor(row_factory=tuple_row) as (conn, cur):
+            cur.execute("SELECT id FROM sites WHERE slug = %s", (site_slug,))
+            row = cur.fetchone()
+            return row[0] if row else None
@@ -2,16 +2,16 @@
 Organization repository.
 """
 
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import BaseModel
-
-from inventory.db.connection import get_connection
 from inventory.db.repository import BaseRepository
+from inventory.models.base import UpdateBase
 from inventory.models.organization import Organization, OrganizationCreate
 
 
-class OrganizationUpdate(BaseModel):
+@dataclass
+class OrganizationUpdate(UpdateBase):
     """Fields for updating an organization."""
 
     name: Optional[str] = None
@@ -32,19 +32,18 @@ class OrganizationRepository(BaseRepository[Organization, OrganizationCreate, Or
 
     def get_with_site_count(self, slug: str) -> Optional[dict]:
         """Get organization with site count."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT o.*, COUNT(s.id) as site_count
-                    FROM organizations o
-                    LEFT JOIN sites s ON o.id = s.organization_id
-                    WHERE o.slug = %s
-                    GROUP BY o.id
-                    """,
-                    (slug,),
-                )
-                return cur.fetchone()
+        with self._cursor() as (conn, cur):
+            cur.execute(
+                """
+                SELECT o.*, COUNT(s.id) as site_count
+                FROM organizations o
+                LEFT JOIN sites s ON o.id = s.organization_id
+                WHERE o.slug = %s
+                GROUP BY o.id
+                """,
+                (slug,),
+            )
+            return cur.fetchone()
 
     def list_active(self) -> list[Organization]:
         """List only active organizations."""
@@ -3,17 +3,74 @@ Base repository pattern for database operations.
 """
 
 import re
+import string
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Optional, TypeVar
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Generic, Iterator, Optional, Protocol, TypeVar, cast
 from uuid import UUID
 
-from pydantic import BaseModel
+import psycopg
+from psycopg import sql
+from psycopg.rows import RowFactory, tuple_row
+from pydantic import BaseModel, TypeAdapter
 
 from inventory.db.connection import get_connection
 
 T = TypeVar("T", bound=BaseModel)
 CreateT = TypeVar("CreateT", bound=BaseModel)
-UpdateT = TypeVar("UpdateT", bound=BaseModel)
+
+
+class UpdatePayload(Protocol):
+    """Anything that can report the fields it updates."""
+
+    def to_dict(self) -> dict[str, Any]: ...
+
+
+UpdateT = TypeVar("UpdateT", bound=UpdatePayload)
+
+# Slug separators: any run of characters outside [a-z0-9]
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# ASCII fast path: map every non-[a-z0-9] character to a space so that
+# str.split() collapses runs and trims the ends in one pass
+_SLUG_ASCII_MAP = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if c not in string.ascii_lowercase + string.digits}
+)
+
+# Rows fetched per round-trip when streaming from a server-side cursor
+STREAM_ITERSIZE = 500
+
+
+# Fixed per-table statements, composed once per (op, table) by _table_query
+_QUERY_TEMPLATES = {
+    "get_by_id": "SELECT * FROM {table} WHERE id = %s",
+    "get_by_slug": "SELECT * FROM {table} WHERE slug = %s",
+    "delete": "DELETE FROM {table} WHERE slug = %s RETURNING id",
+    "exists": "SELECT 1 FROM {table} WHERE slug = %s LIMIT 1",
+}
+
+
+@lru_cache
+def _table_query(op: str, table: str) -> sql.Composed:
+    """Get the composed statement for an operation on a table."""
+    return sql.SQL(_QUERY_TEMPLATES[op]).format(table=sql.Identifier(table))
+
+
+def _where(filters: Optional[dict[str, Any]]) -> tuple[sql.Composable, list[Any]]:
+    """Build a WHERE clause of column = value filters."""
+    if not filters:
+        return sql.SQL(""), []
+    clause = sql.SQL(" WHERE ") + sql.SQL(" AND ").join(
+        sql.SQL("{} = %s").format(sql.Identifier(key)) for key in filters
+    )
+    return clause, list(filters.values())
+
+
+@lru_cache
+def _list_adapter(model_class: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Get a cached list validator for a model class."""
+    return TypeAdapter(list[model_class])  # type: ignore[valid-type]
 
 
 class BaseRepository(ABC, Generic[T, CreateT, UpdateT]):
@@ -34,53 +91,80 @@ class BaseRepository(ABC, Generic[T, CreateT, UpdateT]):
     @staticmethod
     def generate_slug(name: str) -> str:
         """Generate a URL-friendly slug from a name."""
-        return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+        name = name.lower()
+        if name.isascii():
+            return "-".join(name.translate(_SLUG_ASCII_MAP).split())
+        return _SLUG_RE.sub("-", name).strip("-")
+
+    @contextmanager
+    def _cursor(
+        self, name: Optional[str] = None, row_factory: Optional[RowFactory] = None
+    ) -> Iterator[tuple[psycopg.Connection[Any], psycopg.Cursor[Any]]]:
+        """Open a connection and one cursor shared by every query in a call.
+
+        Passing a name opens a server-side cursor that fetches
+        STREAM_ITERSIZE rows per round-trip when iterated. Rows are dicts
+        unless another row_factory is given, e.g. tuple_row for lookups
+        that only read a single column.
+        """
+        options: dict[str, Any] = {"row_factory": row_factory} if row_factory else {}
+        with get_connection() as conn:
+            if name:
+                with conn.cursor(name=name, **options) as cur:
+                    cur.itersize = STREAM_ITERSIZE
+                    yield conn, cur
+            else:
+                with conn.cursor(**options) as cur:
+                    yield conn, cur
 
     def get_by_id(self, id: UUID) -> Optional[T]:
         """Get entity by ID."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"SELECT * FROM {self.table_name} WHERE id = %s", (id,)
-                )
-                row = cur.fetchone()
-                return self.model_class(**row) if row else None
+        with self._cursor() as (conn, cur):
+            cur.execute(_table_query("get_by_id", self.table_name), (id,))
+            row = cur.fetchone()
+            return self.model_class(**row) if row else None
 
     def get_by_slug(self, slug: str) -> Optional[T]:
         """Get entity by slug."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"SELECT * FROM {self.table_name} WHERE slug = %s", (slug,)
-                )
-                row = cur.fetchone()
-                return self.model_class(**row) if row else None
+        with self._cursor() as (conn, cur):
+            cur.execute(_table_query("get_by_slug", self.table_name), (slug,))
+            row = cur.fetchone()
+            return self.model_class(**row) if row else None
 
     def list_all(
         self,
         filters: Optional[dict[str, Any]] = None,
         order_by: str = "name",
-        limit: int = 100,
+        limit: Optional[int] = 100,
     ) -> list[T]:
         """List all entities with optional filters."""
-        query = f"SELECT * FROM {self.table_name}"
-        params: list[Any] = []
-
-        if filters:
-            where_clauses = []
-            for key, value in filters.items():
-                where_clauses.append(f"{key} = %s")
-                params.append(value)
-            query += " WHERE " + " AND ".join(where_clauses)
+        rows = self.list_raw(filters=filters, order_by=order_by, limit=limit)
+        return cast(list[T], _list_adapter(self.model_class).validate_python(rows))
 
-        query += f" ORDER BY {order_by} LIMIT %s"
+    def list_raw(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        order_by: str = "name",
+        limit: Optional[int] = 100,
+    ) -> list[dict]:
+        """List all entities as plain rows, skipping model validation.
+
+        Use for display-only paths (e.g. rendering a table) where the rows
+        are never mutated or passed on as models. Pass limit=None to return
+        every row (LIMIT NULL means no limit in PostgreSQL).
+        """
+        where, params = _where(filters)
+        # order_by is an expression (e.g. "name DESC"), not just an identifier
+        query = sql.SQL("SELECT * FROM {table}{where} ORDER BY {order_by} LIMIT %s").format(
+            table=sql.Identifier(self.table_name),
+            where=where,
+            order_by=sql.SQL(order_by),
+        )
         params.append(limit)
 
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query, params)
-                rows = cur.fetchall()
-                return [self.model_class(**row) for row in rows]
+        with self._cursor() as (conn, cur):
+            cur.execute(query, params)
+            return cur.fetchall()
 
     def create(self, data: CreateT) -> T:
         """Create a new entity."""
@@ -90,85 +174,60 @@ class BaseRepository(ABC, Generic[T, CreateT, UpdateT]):
         if "slug" not in fields and "name" in fields:
             fields["slug"] = self.generate_slug(fields["name"])
 
-        columns = ", ".join(fields.keys())
-        placeholders = ", ".join(["%s"] * len(fields))
-        values = list(fields.values())
+        query = sql.SQL("INSERT INTO {table} ({columns}) VALUES ({values}) RETURNING *").format(
+            table=sql.Identifier(self.table_name),
+            columns=sql.SQL(", ").join(map(sql.Identifier, fields)),
+            values=sql.SQL(", ").join(sql.Placeholder() * len(fields)),
+        )
 
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"""
-                    INSERT INTO {self.table_name} ({columns})
-                    VALUES ({placeholders})
-                    RETURNING *
-                    """,
-                    values,
-                )
-                row = cur.fetchone()
-                conn.commit()
-                return self.model_class(**row)
+        with self._cursor() as (conn, cur):
+            cur.execute(query, list(fields.values()))
+            row = cur.fetchone()
+            conn.commit()
+            return self.model_class(**row)
 
     def update(self, slug: str, data: UpdateT) -> Optional[T]:
         """Update an entity by slug."""
-        fields = data.model_dump(exclude_none=True, exclude_unset=True)
+        fields = data.to_dict()
 
         if not fields:
             return self.get_by_slug(slug)
 
-        set_clause = ", ".join(f"{k} = %s" for k in fields.keys())
-        values = list(fields.values()) + [slug]
+        query = sql.SQL("UPDATE {table} SET {assignments} WHERE slug = %s RETURNING *").format(
+            table=sql.Identifier(self.table_name),
+            assignments=sql.SQL(", ").join(
+                sql.SQL("{} = %s").format(sql.Identifier(key)) for key in fields
+            ),
+        )
 
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"""
-                    UPDATE {self.table_name}
-                    SET {set_clause}
-                    WHERE slug = %s
-                    RETURNING *
-                    """,
-                    values,
-                )
-                row = cur.fetchone()
-                conn.commit()
-                return self.model_class(**row) if row else None
+        with self._cursor() as (conn, cur):
+            cur.execute(query, list(fields.values()) + [slug])
+            row = cur.fetchone()
+            conn.commit()
+            return self.model_class(**row) if row else None
 
     def delete(self, slug: str) -> bool:
         """Delete an entity by slug."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"DELETE FROM {self.table_name} WHERE slug = %s RETURNING id",
-                    (slug,),
-                )
-                result = cur.fetchone()
-                conn.commit()
-                return result is not None
+        with self._cursor(row_factory=tuple_row) as (conn, cur):
+            cur.execute(_table_query("delete", self.table_name), (slug,))
+            result = cur.fetchone()
+            conn.commit()
+            return result is not None
 
     def exists(self, slug: str) -> bool:
         """Check if entity exists by slug."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"SELECT 1 FROM {self.table_name} WHERE slug = %s LIMIT 1",
-                    (slug,),
-                )
-                return cur.fetchone() is not None
+        with self._cursor(row_factory=tuple_row) as (conn, cur):
+            cur.execute(_table_query("exists", self.table_name), (slug,))
+            return cur.fetchone() is not None
 
     def count(self, filters: Optional[dict[str, Any]] = None) -> int:
         """Count entities with optional filters."""
-        query = f"SELECT COUNT(*) as count FROM {self.table_name}"
-        params: list[Any] = []
-
-        if filters:
-            where_clauses = []
-            for key, value in filters.items():
-                where_clauses.append(f"{key} = %s")
-                params.append(value)
-            query += " WHERE " + " AND ".join(where_clauses)
-
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query, params)
-                row = cur.fetchone()
-                return row["count"] if row else 0
+        where, params = _where(filters)
+        query = sql.SQL("SELECT COUNT(*) as count FROM {table}{where}").format(
+            table=sql.Identifier(self.table_name), where=where
+        )
+
+        with self._cursor(row_factory=tuple_row) as (conn, cur):
+            cur.execute(query, params)
+            row = cur.fetchone()
+            return row[0] if row else 0
@@ -2,11 +2,71 @@
 Main CLI entry point for the inventory management tool.
 """
 
+import importlib
+from functools import lru_cache
+from typing import Optional
+
+import click
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
 
 from inventory import __version__
-from inventory.commands import db, device, network, org, site, zone
+
+# Command groups: name -> (module, help). Modules are imported on first use so
+# that e.g. `inv version` does not pay for psycopg, pydantic and every command.
+COMMAND_GROUPS = {
+    "org": ("inventory.commands.org", "Organization management"),
+    "site": ("inventory.commands.site", "Site management"),
+    "device": ("inventory.commands.device", "Device management"),
+    "network": ("inventory.commands.network", "Network management"),
+    "zone": ("inventory.commands.zone", "Zone management"),
+    "db": ("inventory.commands.db", "Database operations"),
+}
+
+
+# ctx.meta flag set while the root help is rendered
+_LISTING_HELP = "inventory.listing_help"
+
+
+@lru_cache
+def _load_group(name: str) -> click.Command:
+    """Import a command group module and build its Click command."""
+    module_name, help_text = COMMAND_GROUPS[name]
+    module = importlib.import_module(module_name)
+    command = typer.main.get_command(module.app)
+    command.name = name
+    command.help = help_text
+    return command
+
+
+@lru_cache
+def _group_placeholder(name: str) -> click.Command:
+    """Build a stand-in carrying only a command group's name and help."""
+    return click.Command(name, help=COMMAND_GROUPS[name][1])
+
+
+class LazyGroup(TyperGroup):
+    """Root command group that resolves command groups lazily."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*COMMAND_GROUPS, *super().list_commands(ctx)])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in COMMAND_GROUPS:
+            if ctx.meta.get(_LISTING_HELP):
+                return _group_placeholder(cmd_name)
+            return _load_group(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        # Listing a group only needs its name and help, so `inv --help` is
+        # served from COMMAND_GROUPS without importing any group module
+        ctx.meta[_LISTING_HELP] = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            del ctx.meta[_LISTING_HELP]
+
 
 # Create main app
 app = typer.Typer(
@@ -14,31 +74,26 @@ app = typer.Typer(
     help="Device inventory and infrastructure management CLI",
     no_args_is_help=True,
     rich_markup_mode="rich",
+    cls=LazyGroup,
 )
 
-# Console for rich output
-console = Console()
-
-# Register command groups
-app.add_typer(org.app, name="org", help="Organization management")
-app.add_typer(site.app, name="site", help="Site management")
-app.add_typer(device.app, name="device", help="Device management")
-app.add_typer(network.app, name="network", help="Network management")
-app.add_typer(zone.app, name="zone", help="Zone management")
-app.add_typer(db.app, name="db", help="Database operations")
-
 
 @app.command()
 def version():
     """Show version information."""
-    console.print(f"[bold]ra-inventory[/bold] v{__version__}")
+    from rich.console import Console
+
+    Console().print(f"[bold]ra-inventory[/bold] v{__version__}")
 
 
 @app.command()
 def status():
     """Show system status and database connection."""
+    from rich.console import Console
+
     from inventory.db.connection import get_connection_status
 
+    console = Console()
     status = get_connection_status()
 
     if status["connected"]:
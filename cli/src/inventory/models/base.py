@@ -2,25 +2,47 @@
 Base model with common fields.
 """
 
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BaseEntity(BaseModel):
     """Base entity with common fields."""
 
-    model_config = ConfigDict(from_attributes=True)
+    # Entities are read-only snapshots of database rows
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: UUID
     created_at: datetime
     updated_at: datetime
-    metadata: dict[str, Any] = {}
+    metadata: dict[str, Any] = Field(default_factory=dict)
 
 
 class SlugMixin(BaseModel):
     """Mixin for entities with slug field."""
 
     slug: str
+
+
+@dataclass
+class UpdateBase:
+    """Base for partial-update payloads without validation.
+
+    Fields left as None are not written.
+    """
+
+    # Field names, cached per subclass on first use. Not set in
+    # __init_subclass__, which runs before the @dataclass decorator.
+    _field_names: ClassVar[tuple[str, ...]] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields to update."""
+        cls = type(self)
+        names = cls.__dict__.get("_field_names")
+        if names is None:
+            names = cls._field_names = tuple(f.name for f in fields(cls))
+        return {name: value for name in names if (value := getattr(self, name)) is not None}
@@ -4,7 +4,7 @@ Device model.
 
 import re
 from datetime import date
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -14,6 +14,26 @@ from inventory.models.base import BaseEntity, SlugMixin
 DeviceStatus = Literal["online", "offline", "unknown", "maintenance"]
 UsageStatus = Literal["active", "stored", "failed", "retired", "pending"]
 
+# Already-normalized MAC address, e.g. 00:1A:2B:3C:4D:5E
+_MAC_RE = re.compile(r"[0-9A-F]{2}(?::[0-9A-F]{2}){5}")
+
+# MAC normalization tables: uppercase hex digits and delete every other byte
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+_MAC_UPPER = bytes.maketrans(b"abcdef", b"ABCDEF")
+_MAC_DROP = bytes(c for c in range(256) if c not in _HEX_DIGITS)
+
+
+def _normalize_mac(v: Optional[str]) -> Optional[str]:
+    """Normalize a MAC address in any separator style to XX:XX:XX:XX:XX:XX."""
+    if v is None or _MAC_RE.fullmatch(v):
+        return v
+    # Non-ASCII characters are never hex digits, so dropping them is safe
+    digits = v.encode("ascii", "ignore").translate(_MAC_UPPER, _MAC_DROP)
+    if len(digits) != 12:
+        raise ValueError("MAC address must be 12 hex characters")
+    mac = digits.decode("ascii")
+    return ":".join(mac[i : i + 2] for i in range(0, 12, 2))
+
 
 class DeviceBase(BaseModel):
     """Base device fields."""
@@ -38,13 +58,7 @@ class DeviceBase(BaseModel):
     @field_validator("mac_address")
     @classmethod
     def validate_mac(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        # Accept various MAC formats and normalize
-        mac = re.sub(r"[^0-9A-Fa-f]", "", v)
-        if len(mac) != 12:
-            raise ValueError("MAC address must be 12 hex characters")
-        return ":".join(mac[i : i + 2].upper() for i in range(0, 12, 2))
+        return _normalize_mac(v)
 
 
 class DeviceCreate(DeviceBase):
@@ -77,12 +91,11 @@ class DeviceUpdate(BaseModel):
     @field_validator("mac_address")
     @classmethod
     def validate_mac(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        mac = re.sub(r"[^0-9A-Fa-f]", "", v)
-        if len(mac) != 12:
-            raise ValueError("MAC address must be 12 hex characters")
-        return ":".join(mac[i : i + 2].upper() for i in range(0, 12, 2))
+        return _normalize_mac(v)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields to update."""
+        return self.model_dump(exclude_none=True, exclude_unset=True)
 
 
 class Device(DeviceBase, SlugMixin, BaseEntity):
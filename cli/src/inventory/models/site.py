@@ -40,3 +40,6 @@ class Site(SiteBase, SlugMixin, BaseEntity):
     organization_id: UUID
     latitude: Optional[float] = None
     longitude: Optional[float] = None
+    zone_count: int = 0
+    network_count: int = 0
+    device_count: int = 0
@@ -1,30 +1,111 @@
 """Pytest fixtures for ra-inventory CLI tests."""
 
+import functools
+import io
+from contextlib import redirect_stdout
+from unittest.mock import Mock
+
+import click
 import pytest
+import typer
 from typer.testing import CliRunner
 
 from inventory.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     """Create a CLI test runner."""
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_app():
     """Return the Typer app for testing."""
     return app
 
 
+@functools.cache
+def _root_command() -> click.Group:
+    """Build the Click command tree for the app once per session."""
+    return typer.main.get_command(app)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_cli():
+    """Build the command tree, including the lazy command groups, up front."""
+    root = _root_command()
+    ctx = click.Context(root, info_name="inv")
+    for name in root.list_commands(ctx):
+        root.get_command(ctx, name)
+
+
+@pytest.fixture(scope="session")
+def help_text():
+    """Return a function that renders `inv <args> --help`, once per command.
+
+    Help is rendered straight from the Click command tree rather than by
+    invoking the CLI, and cached for the rest of the session.
+    """
+    root = _root_command()
+    cache: dict[tuple[str, ...], str] = {}
+
+    def _get(*args: str) -> str:
+        if args not in cache:
+            command = root
+            ctx = click.Context(root, info_name="inv")
+            for name in args:
+                command = command.get_command(ctx, name)
+                assert command is not None, f"unknown command: inv {' '.join(args)}"
+                ctx = click.Context(command, info_name=name, parent=ctx)
+            # Typer's rich formatter prints the help instead of returning it
+            with redirect_stdout(io.StringIO()) as out:
+                text = command.get_help(ctx)
+            cache[args] = out.getvalue() or text
+        return cache[args]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def help_tokens(help_text):
+    """Return a function giving the whitespace-separated words of a command's help.
+
+    Commas are treated as separators so "--site, -s" yields both flags.
+    """
+    cache: dict[tuple[str, ...], frozenset[str]] = {}
+
+    def _get(*args: str) -> frozenset[str]:
+        if args not in cache:
+            cache[args] = frozenset(help_text(*args).replace(",", " ").split())
+        return cache[args]
+
+    return _get
+
+
+class _ContextManager:
+    """Minimal context manager that yields a fixed value."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __enter__(self):
+        return self.value
+
+    def __exit__(self, *exc_info):
+        return False
+
+
 @pytest.fixture
-def mock_db_connection(mocker):
-    """Mock database connection for unit tests."""
-    mock_conn = mocker.MagicMock()
-    mock_cursor = mocker.MagicMock()
-    mock_conn.__enter__ = mocker.MagicMock(return_value=mock_conn)
-    mock_conn.__exit__ = mocker.MagicMock(return_value=False)
-    mock_conn.cursor.return_value.__enter__ = mocker.MagicMock(return_value=mock_cursor)
-    mock_conn.cursor.return_value.__exit__ = mocker.MagicMock(return_value=False)
+def mock_db_connection():
+    """Mock database connection for unit tests.
+
+    The connection can be used as a context manager, and conn.cursor()
+    yields the returned mock cursor.
+    """
+    mock_cursor = Mock()
+    mock_conn = Mock()
+    mock_conn.__enter__ = Mock(return_value=mock_conn)
+    mock_conn.__exit__ = Mock(return_value=False)
+    mock_conn.cursor.return_value = _ContextManager(mock_cursor)
     return mock_conn, mock_cursor
@@ -1,6 +1,30 @@
 """Tests for base repository."""
 
-from inventory.db.repository import BaseRepository
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from psycopg.rows import tuple_row
+
+from inventory.db import repository
+from inventory.db.repositories import OrganizationRepository, SiteRepository
+from inventory.db.repositories.site import SiteUpdate
+from inventory.db.repository import (
+    STREAM_ITERSIZE,
+    BaseRepository,
+    _list_adapter,
+    _table_query,
+    _where,
+)
+from inventory.models.organization import Organization, OrganizationCreate
+
+
+@pytest.fixture
+def db(monkeypatch, mock_db_connection):
+    """Route repository connections to the mock connection."""
+    conn, _ = mock_db_connection
+    monkeypatch.setattr(repository, "get_connection", lambda: conn)
+    return mock_db_connection
 
 
 class TestSlugGeneration:
@@ -49,3 +73,161 @@ class TestSlugGeneration:
     def test_name_with_ampersand(self):
         """Test slug from name with ampersand."""
         assert BaseRepository.generate_slug("Living & Dining") == "living-dining"
+
+    def test_name_with_non_ascii(self):
+        """Test slug drops non-ASCII characters."""
+        assert BaseRepository.generate_slug("Café Bar") == "caf-bar"
+
+    def test_name_with_tabs_and_newlines(self):
+        """Test slug treats all whitespace as a separator."""
+        assert BaseRepository.generate_slug("Test\tName\n") == "test-name"
+
+
+class TestListAdapter:
+    """Tests for bulk row validation."""
+
+    def test_validates_rows_into_models(self):
+        """Test rows are hydrated into model instances."""
+        now = datetime.now(timezone.utc)
+        rows = [{"id": uuid4(), "name": "Org", "slug": "org", "created_at": now, "updated_at": now}]
+        orgs = _list_adapter(Organization).validate_python(rows)
+        assert isinstance(orgs[0], Organization)
+        assert orgs[0].slug == "org"
+
+    def test_adapter_is_cached_per_model(self):
+        """Test the adapter is built once per model class."""
+        assert _list_adapter(Organization) is _list_adapter(Organization)
+
+
+class TestCursor:
+    """Tests for the shared repository cursor."""
+
+    def test_yields_connection_and_cursor(self, db):
+        """Test the helper yields the connection and a client-side cursor."""
+        conn, _ = db
+        with OrganizationRepository()._cursor() as (c, cur):
+            assert c is conn
+            assert cur is conn.cursor.return_value.value
+        conn.cursor.assert_called_once_with()
+
+    def test_named_cursor_streams(self, db):
+        """Test a named cursor is server-side with the streaming itersize."""
+        conn, _ = db
+        with OrganizationRepository()._cursor("stream_test") as (_, cur):
+            assert cur.itersize == STREAM_ITERSIZE
+        conn.cursor.assert_called_once_with(name="stream_test")
+
+    def test_row_factory_override(self, db):
+        """Test a row factory is passed through to the cursor."""
+        conn, _ = db
+        with OrganizationRepository()._cursor(row_factory=tuple_row):
+            pass
+        conn.cursor.assert_called_once_with(row_factory=tuple_row)
+
+    def test_count_reads_tuple_row(self, db):
+        """Test count reads the first column of a tuple row."""
+        conn, cursor = db
+        cursor.fetchone.return_value = (7,)
+        assert OrganizationRepository().count() == 7
+        conn.cursor.assert_called_once_with(row_factory=tuple_row)
+
+
+class TestLookups:
+    """Tests for repository queries against a mock connection."""
+
+    def test_exists(self, db):
+        """Test exists is true when a row comes back."""
+        _, cursor = db
+        cursor.fetchone.return_value = (1,)
+        assert OrganizationRepository().exists("acme") is True
+
+    def test_exists_missing(self, db):
+        """Test exists is false when no row comes back."""
+        _, cursor = db
+        cursor.fetchone.return_value = None
+        assert OrganizationRepository().exists("missing") is False
+
+    def test_list_raw_without_limit(self, db):
+        """Test limit=None is passed through so every row is returned."""
+        _, cursor = db
+        cursor.fetchall.return_value = []
+        OrganizationRepository().list_raw(limit=None)
+        _, params = cursor.execute.call_args.args
+        assert params == [None]
+
+
+class TestUpdatePayload:
+    """Tests for dataclass update payloads."""
+
+    def test_to_dict_skips_unset_fields(self):
+        """Test only fields that were given are returned."""
+        assert SiteUpdate(name="New Name", is_primary=False).to_dict() == {
+            "name": "New Name",
+            "is_primary": False,
+        }
+
+    def test_to_dict_empty(self):
+        """Test an empty update has no fields."""
+        assert SiteUpdate().to_dict() == {}
+
+
+class TestQueryComposition:
+    """Tests for composed SQL statements."""
+
+    def test_table_query_is_cached(self):
+        """Test each (op, table) statement is composed once."""
+        assert _table_query("get_by_slug", "zones") is _table_query("get_by_slug", "zones")
+        assert _table_query("get_by_slug", "zones") is not _table_query("get_by_slug", "sites")
+
+    def test_where_without_filters(self):
+        """Test no filters produce no clause or params."""
+        clause, params = _where(None)
+        assert clause.as_string(None) == ""
+        assert params == []
+
+    def test_where_collects_params_in_order(self):
+        """Test filter values are returned in column order."""
+        clause, params = _where({"is_active": True, "site_type": "office"})
+        assert clause.as_string(None) == ' WHERE "is_active" = %s AND "site_type" = %s'
+        assert params == [True, "office"]
+
+    def test_list_raw_query(self, db):
+        """Test list_raw filters, orders and limits the table."""
+        _, cursor = db
+        cursor.fetchall.return_value = []
+        SiteRepository().list_raw(filters={"is_active": True}, order_by="name DESC", limit=5)
+        query, params = cursor.execute.call_args.args
+        assert query.as_string(None) == (
+            'SELECT * FROM "sites" WHERE "is_active" = %s ORDER BY name DESC LIMIT %s'
+        )
+        assert params == [True, 5]
+
+    def test_create_query(self, db):
+        """Test create inserts the given fields plus a generated slug."""
+        _, cursor = db
+        now = datetime.now(timezone.utc)
+        cursor.fetchone.return_value = {
+            "id": uuid4(),
+            "name": "Acme",
+            "slug": "acme",
+            "created_at": now,
+            "updated_at": now,
+        }
+        OrganizationRepository().create(OrganizationCreate(name="Acme"))
+        query, params = cursor.execute.call_args.args
+        assert query.as_string(None) == (
+            'INSERT INTO "organizations" ("name", "type", "is_active", "slug") '
+            "VALUES (%s, %s, %s, %s) RETURNING *"
+        )
+        assert params == ["Acme", "home", True, "acme"]
+
+    def test_update_query(self, db):
+        """Test update sets only the given fields on the matching slug."""
+        _, cursor = db
+        cursor.fetchone.return_value = None
+        SiteRepository().update("hq", SiteUpdate(name="HQ", is_primary=False))
+        query, params = cursor.execute.call_args.args
+        assert query.as_string(None) == (
+            'UPDATE "sites" SET "name" = %s, "is_primary" = %s WHERE slug = %s RETURNING *'
+        )
+        assert params == ["HQ", False, "hq"]
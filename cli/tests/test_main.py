@@ -0,0 +1,65 @@
+"""Tests for the main CLI entry point."""
+
+import subprocess
+import sys
+
+from inventory import __version__
+from inventory.main import COMMAND_GROUPS
+
+
+class TestVersion:
+    """Tests for 'inv version' command."""
+
+    def test_version(self, runner, cli_app):
+        """Test that version prints the package version."""
+        result = runner.invoke(cli_app, ["version"])
+        assert result.exit_code == 0
+        assert __version__ in result.stdout
+
+    def test_version_does_not_import_command_groups(self):
+        """Test that command group modules are only imported when used."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from inventory.main import app\n"
+            "CliRunner().invoke(app, ['version'])\n"
+            "print([m for m in sys.modules if m.startswith('inventory.commands.')])\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+
+class TestHelp:
+    """Tests for 'inv --help'."""
+
+    def test_lists_command_groups(self, runner, cli_app):
+        """Test that lazily loaded command groups appear in help."""
+        result = runner.invoke(cli_app, ["--help"])
+        assert result.exit_code == 0
+        for name in COMMAND_GROUPS:
+            assert name in result.stdout
+
+    def test_lists_commands_alphabetically(self, runner, cli_app):
+        """Test that commands keep Click's alphabetical help order."""
+        result = runner.invoke(cli_app, ["--help"])
+        commands = result.stdout.split("Commands")[1]
+        names = [*COMMAND_GROUPS, "status", "version"]
+        positions = [commands.index(f" {name} ") for name in names]
+        assert [n for _, n in sorted(zip(positions, names))] == sorted(names)
+
+    def test_help_does_not_import_command_groups(self):
+        """Test that listing command groups imports no group module or psycopg."""
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from inventory.main import app\n"
+            "assert CliRunner().invoke(app, ['--help']).exit_code == 0\n"
+            "print([m for m in sys.modules\n"
+            "       if m.startswith('inventory.commands.') or m == 'psycopg'])\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
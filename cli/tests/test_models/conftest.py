@@ -0,0 +1,90 @@
+"""Pytest fixtures for model tests."""
+
+import os
+from datetime import datetime, timezone
+from functools import partial
+from uuid import UUID
+
+import pytest
+
+from inventory.models.device import DeviceCreate
+from inventory.models.network import NetworkCreate
+from inventory.models.zone import ZoneCreate
+
+# Fixed IDs: model tests only round-trip them, so they need not be random
+ENTITY_ID = UUID(int=1)
+ORG_ID = UUID(int=2)
+SITE_ID = UUID(int=3)
+PARENT_ZONE_ID = UUID(int=4)
+
+# Per-test budget for model tests. Constructing a model should take well under
+# a millisecond; the default leaves headroom for coverage tracing and loaded CI
+# runners while still catching a validator that regresses by orders of magnitude.
+MAX_CALL_SECONDS = float(os.environ.get("MODEL_TEST_MAX_SECONDS", "0.05"))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Fail model tests whose call phase exceeds MAX_CALL_SECONDS.
+
+    Hypothesis tests and benchmarks run many iterations in one call, so they
+    are exempt.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if getattr(item.obj, "is_hypothesis_test", False) or "benchmark" in item.fixturenames:
+        return
+    if report.when == "call" and report.passed and call.duration > MAX_CALL_SECONDS:
+        report.outcome = "failed"
+        report.longrepr = (
+            f"{item.nodeid} took {call.duration * 1000:.1f} ms, over the "
+            f"{MAX_CALL_SECONDS * 1000:.1f} ms model test budget; check for a slow validator"
+        )
+
+
+@pytest.fixture(scope="session")
+def entity_id():
+    """Return an ID for the entity under test."""
+    return ENTITY_ID
+
+
+@pytest.fixture(scope="session")
+def org_id():
+    """Return an organization ID."""
+    return ORG_ID
+
+
+@pytest.fixture(scope="session")
+def site_id():
+    """Return a site ID."""
+    return SITE_ID
+
+
+@pytest.fixture(scope="session")
+def parent_zone_id():
+    """Return a parent zone ID."""
+    return PARENT_ZONE_ID
+
+
+@pytest.fixture(scope="session")
+def now():
+    """Return a timezone-aware timestamp for created_at/updated_at fields."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="class")
+def make_device(site_id):
+    """Return a DeviceCreate factory with the required fields for a router."""
+    return partial(DeviceCreate, name="Test", device_type="router", site_id=site_id)
+
+
+@pytest.fixture(scope="class")
+def make_network(site_id):
+    """Return a NetworkCreate factory with the required fields for a LAN."""
+    return partial(NetworkCreate, name="Test", network_type="ethernet", site_id=site_id)
+
+
+@pytest.fixture(scope="class")
+def make_zone(site_id):
+    """Return a ZoneCreate factory with the required fields."""
+    return partial(ZoneCreate, name="Test", site_id=site_id)
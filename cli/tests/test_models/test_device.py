@@ -1,46 +1,65 @@
 """Tests for device models."""
 
-from datetime import date, datetime, timezone
-from uuid import uuid4
+import re
+from datetime import date
 
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from pydantic import ValidationError
 
+from inventory.models import device as device_module
 from inventory.models.device import Device, DeviceCreate, DeviceUpdate
 
+# MAC address test vectors: every input in MAC_INPUTS normalizes to MAC_CANONICAL
+MAC_CANONICAL = "00:1A:2B:3C:4D:5E"
+MAC_INPUTS = (
+    "00:1A:2B:3C:4D:5E",
+    "00-1A-2B-3C-4D-5E",
+    "001A2B3C4D5E",
+    "00:1a:2b:3c:4d:5e",
+    "001a.2b3c.4d5e",
+    " 00 1a 2b 3c 4d 5e ",
+)
+# Random MAC addresses as 12 uppercase hex digits, e.g. 001A2B3C4D5E
+mac_hex = st.binary(min_size=6, max_size=6).map(lambda b: b.hex().upper())
+
+MAC_BAD = ("invalid", "00:1A:2B", "GG:GG:GG:GG:GG:GG", "00:1A:2B:3C:4D:5E:6F")
+
 
 class TestDeviceCreate:
     """Tests for DeviceCreate model."""
 
-    def test_create_with_required_fields(self):
+    def test_create_with_required_fields(self, site_id):
         """Test creating device with only required fields."""
         device = DeviceCreate(
             name="Test Device",
             device_type="sensor",
-            site_id=uuid4(),
+            site_id=site_id,
         )
         assert device.name == "Test Device"
         assert device.device_type == "sensor"
         assert device.status == "unknown"
         assert device.usage_status == "active"
 
-    def test_create_with_usage_status(self):
+    def test_create_with_usage_status(self, site_id):
         """Test creating device with usage status."""
         device = DeviceCreate(
             name="Spare Switch",
             device_type="switch",
-            site_id=uuid4(),
+            site_id=site_id,
             usage_status="stored",
             storage_location="Server closet shelf 3",
         )
         assert device.usage_status == "stored"
         assert device.storage_location == "Server closet shelf 3"
 
-    def test_create_with_failure_info(self):
+    def test_create_with_failure_info(self, site_id):
         """Test creating device with failure information."""
         device = DeviceCreate(
             name="Dead Sensor",
             device_type="sensor",
-            site_id=uuid4(),
+            site_id=site_id,
             usage_status="failed",
             failure_date=date(2025, 11, 1),
             failure_reason="Stopped responding, no LED",
@@ -51,65 +70,72 @@ class TestDeviceCreate:
         assert device.failure_reason == "Stopped responding, no LED"
         assert device.rma_reference == "RMA-12345"
 
-    def test_mac_address_validation_colon_format(self):
-        """Test MAC address validation with colons."""
-        device = DeviceCreate(
-            name="Test",
-            device_type="router",
-            site_id=uuid4(),
-            mac_address="00:1A:2B:3C:4D:5E",
-        )
-        assert device.mac_address == "00:1A:2B:3C:4D:5E"
+    @pytest.mark.parametrize("mac_in", MAC_INPUTS)
+    def test_mac_valid(self, make_device, mac_in):
+        """Test MAC addresses are normalized to uppercase colon format."""
+        device = make_device(mac_address=mac_in)
+        assert device.mac_address == MAC_CANONICAL
 
-    def test_mac_address_validation_dash_format(self):
-        """Test MAC address validation with dashes."""
-        device = DeviceCreate(
-            name="Test",
-            device_type="router",
-            site_id=uuid4(),
-            mac_address="00-1A-2B-3C-4D-5E",
-        )
-        assert device.mac_address == "00:1A:2B:3C:4D:5E"
+    @settings(max_examples=50)
+    @given(mac=mac_hex, sep=st.sampled_from(["", ":", "-"]), lower=st.booleans())
+    def test_mac_roundtrip(self, make_device, mac, sep, lower):
+        """Test any MAC address normalizes to its digits in canonical form."""
+        mac_in = sep.join(mac[i : i + 2] for i in range(0, 12, 2))
+        device = make_device(mac_address=mac_in.lower() if lower else mac_in)
+        assert device.mac_address.replace(":", "") == mac
 
-    def test_mac_address_validation_no_separator(self):
-        """Test MAC address validation without separators."""
-        device = DeviceCreate(
-            name="Test",
-            device_type="router",
-            site_id=uuid4(),
-            mac_address="001A2B3C4D5E",
-        )
-        assert device.mac_address == "00:1A:2B:3C:4D:5E"
+    @settings(max_examples=50)
+    @given(mac=mac_hex, index=st.integers(0, 11), char=st.sampled_from("GHXZgz!"))
+    def test_mac_non_hex_digit_rejected(self, make_device, mac, index, char):
+        """Test replacing any hex digit with a non-hex character is rejected."""
+        with pytest.raises(ValidationError, match="12 hex characters"):
+            make_device(mac_address=mac[:index] + char + mac[index + 1 :])
 
-    def test_mac_address_validation_lowercase(self):
-        """Test MAC address validation normalizes to uppercase."""
-        device = DeviceCreate(
-            name="Test",
-            device_type="router",
-            site_id=uuid4(),
-            mac_address="00:1a:2b:3c:4d:5e",
-        )
-        assert device.mac_address == "00:1A:2B:3C:4D:5E"
-
-    def test_mac_address_validation_invalid(self):
-        """Test that invalid MAC address raises error."""
-        with pytest.raises(ValueError):
-            DeviceCreate(
-                name="Test",
-                device_type="router",
-                site_id=uuid4(),
-                mac_address="invalid",
-            )
-
-    def test_mac_address_validation_too_short(self):
-        """Test that short MAC address raises error."""
-        with pytest.raises(ValueError):
-            DeviceCreate(
-                name="Test",
-                device_type="router",
-                site_id=uuid4(),
-                mac_address="00:1A:2B",
-            )
+    @pytest.mark.parametrize("mac_in", ["0:1:2:3:4:5", "0:1A:2B:3C:4D:5E"])
+    def test_mac_short_octets_rejected(self, make_device, mac_in):
+        """Test octets are not zero-padded: fewer than 12 digits is an error."""
+        with pytest.raises(ValidationError, match="12 hex characters"):
+            make_device(mac_address=mac_in)
+
+    @pytest.mark.parametrize("mac_in", ["0001.0203.0405", "0001-0203-0405"])
+    def test_mac_grouped_forms_accepted(self, make_device, mac_in):
+        """Test Cisco-style 4-digit groups normalize like any other separator."""
+        assert make_device(mac_address=mac_in).mac_address == "00:01:02:03:04:05"
+
+    @pytest.mark.parametrize("mac_in", MAC_BAD)
+    def test_mac_invalid(self, make_device, mac_in):
+        """Test that invalid or short MAC addresses raise an error."""
+        with pytest.raises(ValidationError, match="12 hex characters"):
+            make_device(mac_address=mac_in)
+
+
+def _reference_normalize_mac(value):
+    """Regex-based normalization that _normalize_mac must stay equivalent to."""
+    mac = re.sub(r"[^0-9A-Fa-f]", "", value)
+    if len(mac) != 12:
+        raise ValueError("MAC address must be 12 hex characters")
+    return ":".join(mac[i : i + 2].upper() for i in range(0, 12, 2))
+
+
+class TestMacNormalization:
+    """Tests for the shared MAC address normalizer."""
+
+    def test_mac_regex_precompiled(self):
+        """Test the canonical-form pattern is compiled once at import."""
+        assert isinstance(device_module._MAC_RE, re.Pattern)
+
+    @pytest.mark.parametrize("mac_in", MAC_INPUTS)
+    def test_matches_reference(self, mac_in):
+        """Test the translate-based normalizer agrees with the regex version."""
+        assert device_module._normalize_mac(mac_in) == _reference_normalize_mac(mac_in)
+
+    @pytest.mark.parametrize("mac_in", (*MAC_BAD, "é" * 12))
+    def test_rejects_like_reference(self, mac_in):
+        """Test the normalizer rejects the same inputs as the regex version."""
+        with pytest.raises(ValueError, match="12 hex characters"):
+            _reference_normalize_mac(mac_in)
+        with pytest.raises(ValueError, match="12 hex characters"):
+            device_module._normalize_mac(mac_in)
 
 
 class TestDeviceUpdate:
@@ -147,29 +173,36 @@ class TestDeviceUpdate:
         assert update.failure_reason == "Power surge damage"
         assert update.rma_reference == "RMA-99999"
 
-    def test_update_invalid_status(self):
-        """Test update with invalid status raises error."""
-        with pytest.raises(ValueError):
-            DeviceUpdate(status="invalid_status")
+    def test_update_to_dict(self):
+        """Test to_dict returns only the fields that were set."""
+        update = DeviceUpdate(name="New Name", status="online")
+        assert update.to_dict() == {"name": "New Name", "status": "online"}
 
-    def test_update_invalid_usage_status(self):
-        """Test update with invalid usage status raises error."""
-        with pytest.raises(ValueError):
-            DeviceUpdate(usage_status="invalid_usage")
+    @pytest.mark.parametrize(
+        "fields,message",
+        [
+            ({"status": "invalid_status"}, "Input should be 'online'"),
+            ({"usage_status": "invalid_usage"}, "Input should be 'active'"),
+        ],
+    )
+    def test_update_invalid(self, fields, message):
+        """Test update with an invalid status or usage status raises error."""
+        with pytest.raises(ValidationError, match=message):
+            DeviceUpdate(**fields)
 
 
 class TestDevice:
     """Tests for Device model."""
 
-    def test_full_device(self):
+    def test_full_device(self, entity_id, site_id, now):
         """Test full device entity."""
-        now = datetime.now(timezone.utc)
-        device = Device(
-            id=uuid4(),
+        # Field shape only; validated construction is covered by the tests below
+        device = Device.model_construct(
+            id=entity_id,
             name="Test Device",
             slug="test-device",
             device_type="sensor",
-            site_id=uuid4(),
+            site_id=site_id,
             status="online",
             usage_status="active",
             is_active=True,
@@ -180,35 +213,31 @@ class TestDevice:
         assert device.status == "online"
         assert device.usage_status == "active"
 
-    def test_device_with_usage_status_values(self):
-        """Test device with different usage status values."""
-        now = datetime.now(timezone.utc)
-
-        # Test each valid usage status
-        for usage_status in ["active", "stored", "failed", "retired", "pending"]:
-            device = Device(
-                id=uuid4(),
-                name=f"Test {usage_status}",
-                slug=f"test-{usage_status}",
-                device_type="sensor",
-                site_id=uuid4(),
-                status="unknown",
-                usage_status=usage_status,
-                is_active=True,
-                created_at=now,
-                updated_at=now,
-            )
-            assert device.usage_status == usage_status
-
-    def test_device_with_storage_info(self):
+    @pytest.mark.parametrize("usage_status", ["active", "stored", "failed", "retired", "pending"])
+    def test_device_with_usage_status_values(self, entity_id, site_id, now, usage_status):
+        """Test device with each valid usage status value."""
+        device = Device(
+            id=entity_id,
+            name=f"Test {usage_status}",
+            slug=f"test-{usage_status}",
+            device_type="sensor",
+            site_id=site_id,
+            status="unknown",
+            usage_status=usage_status,
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        assert device.usage_status == usage_status
+
+    def test_device_with_storage_info(self, entity_id, site_id, now):
         """Test device with storage location."""
-        now = datetime.now(timezone.utc)
         device = Device(
-            id=uuid4(),
+            id=entity_id,
             name="Spare Router",
             slug="spare-router",
             device_type="router",
-            site_id=uuid4(),
+            site_id=site_id,
             status="offline",
             usage_status="stored",
             storage_location="IT closet, shelf B",
@@ -219,15 +248,14 @@ class TestDevice:
         assert device.usage_status == "stored"
         assert device.storage_location == "IT closet, shelf B"
 
-    def test_device_with_failure_info(self):
+    def test_device_with_failure_info(self, entity_id, site_id, now):
         """Test device with failure information."""
-        now = datetime.now(timezone.utc)
         device = Device(
-            id=uuid4(),
+            id=entity_id,
             name="Dead Switch",
             slug="dead-switch",
             device_type="switch",
-            site_id=uuid4(),
+            site_id=site_id,
             status="offline",
             usage_status="failed",
             failure_date=date(2025, 10, 15),
@@ -0,0 +1,54 @@
+"""Benchmarks for MAC address matching and normalization.
+
+Skipped by default (--benchmark-skip); run with `pytest --benchmark-only -n0`. The re2 case is
+skipped unless google-re2 is installed.
+"""
+
+import random
+
+import pytest
+
+from inventory.models.device import _MAC_RE, _normalize_mac
+
+pytest.importorskip("pytest_benchmark")
+
+SAMPLE_SIZE = 10_000
+
+
+@pytest.fixture(scope="module")
+def canonical_macs():
+    """Return random MAC addresses in canonical XX:XX:XX:XX:XX:XX form."""
+    rng = random.Random(0)
+    return [":".join(f"{rng.randrange(256):02X}" for _ in range(6)) for _ in range(SAMPLE_SIZE)]
+
+
+@pytest.fixture(scope="module")
+def mixed_macs(canonical_macs):
+    """Return the same addresses in a mix of separator and case styles."""
+    styles = [
+        lambda mac: mac,
+        lambda mac: mac.replace(":", "-"),
+        lambda mac: mac.replace(":", ""),
+        lambda mac: mac.lower(),
+    ]
+    return [styles[i % len(styles)](mac) for i, mac in enumerate(canonical_macs)]
+
+
+def test_mac_re(benchmark, canonical_macs):
+    """Benchmark the precompiled stdlib pattern on canonical input."""
+    result = benchmark(lambda: [_MAC_RE.fullmatch(mac) for mac in canonical_macs])
+    assert all(result)
+
+
+def test_mac_re2(benchmark, canonical_macs):
+    """Benchmark the same pattern compiled with google-re2 (DFA)."""
+    re2 = pytest.importorskip("re2")
+    pattern = re2.compile(_MAC_RE.pattern)
+    result = benchmark(lambda: [pattern.fullmatch(mac) for mac in canonical_macs])
+    assert all(result)
+
+
+def test_normalize_mac(benchmark, mixed_macs, canonical_macs):
+    """Benchmark full normalization across separator and case styles."""
+    result = benchmark(lambda: [_normalize_mac(mac) for mac in mixed_macs])
+    assert result == canonical_macs
@@ -1,9 +1,7 @@
 """Tests for site models."""
 
-from datetime import datetime, timezone
-from uuid import uuid4
-
 import pytest
+from pydantic import ValidationError
 
 from inventory.models.site import Site, SiteCreate
 
@@ -11,17 +9,16 @@ from inventory.models.site import Site, SiteCreate
 class TestSiteCreate:
     """Tests for SiteCreate model."""
 
-    def test_create_with_required_fields(self):
+    def test_create_with_required_fields(self, org_id):
         """Test creating site with only required fields."""
-        site = SiteCreate(name="Test Site", organization_id=uuid4())
+        site = SiteCreate(name="Test Site", organization_id=org_id)
         assert site.name == "Test Site"
         assert site.site_type == "residence"
         assert site.timezone == "America/Los_Angeles"
         assert site.is_primary is False
 
-    def test_create_with_all_fields(self):
+    def test_create_with_all_fields(self, org_id):
         """Test creating site with all fields."""
-        org_id = uuid4()
         site = SiteCreate(
             name="Test Site",
             organization_id=org_id,
@@ -38,30 +35,30 @@ class TestSiteCreate:
         assert site.city == "San Francisco"
         assert site.is_primary is True
 
-    def test_create_with_invalid_type(self):
+    def test_create_with_invalid_type(self, org_id):
         """Test that invalid site type raises error."""
-        with pytest.raises(ValueError):
-            SiteCreate(name="Test", organization_id=uuid4(), site_type="invalid")
+        with pytest.raises(ValidationError, match="Input should be 'residence'"):
+            SiteCreate(name="Test", organization_id=org_id, site_type="invalid")
 
-    def test_all_valid_site_types(self):
-        """Test all valid site types."""
-        org_id = uuid4()
-        for site_type in ["residence", "office", "datacenter", "warehouse", "other"]:
-            site = SiteCreate(name="Test", organization_id=org_id, site_type=site_type)
-            assert site.site_type == site_type
+    @pytest.mark.parametrize(
+        "site_type", ["residence", "office", "datacenter", "warehouse", "other"]
+    )
+    def test_site_type_accepted(self, org_id, site_type):
+        """Test each valid site type is accepted."""
+        site = SiteCreate(name="Test", organization_id=org_id, site_type=site_type)
+        assert site.site_type == site_type
 
 
 class TestSite:
     """Tests for Site model."""
 
-    def test_full_site(self):
+    def test_full_site(self, entity_id, org_id, now):
         """Test full site entity."""
-        now = datetime.now(timezone.utc)
         site = Site(
-            id=uuid4(),
+            id=entity_id,
             name="Test Site",
             slug="test-site",
-            organization_id=uuid4(),
+            organization_id=org_id,
             site_type="residence",
             is_active=True,
             is_primary=False,
@@ -71,3 +68,5 @@ class TestSite:
         )
         assert site.name == "Test Site"
         assert site.slug == "test-site"
+        assert site.zone_count == 0
+        assert site.device_count == 0
@@ -1,9 +1,9 @@
 """Tests for zone models."""
 
-from datetime import datetime, timezone
-from uuid import uuid4
-
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from pydantic import ValidationError
 
 from inventory.models.zone import Zone, ZoneCreate
 
@@ -11,75 +11,69 @@ from inventory.models.zone import Zone, ZoneCreate
 class TestZoneCreate:
     """Tests for ZoneCreate model."""
 
-    def test_create_with_required_fields(self):
+    def test_create_with_required_fields(self, site_id):
         """Test creating zone with only required fields."""
-        zone = ZoneCreate(name="Test Zone", site_id=uuid4())
+        zone = ZoneCreate(name="Test Zone", site_id=site_id)
         assert zone.name == "Test Zone"
         assert zone.zone_type == "room"
         assert zone.floor_number is None
         assert zone.parent_zone_id is None
 
-    def test_create_with_all_fields(self):
+    def test_create_with_all_fields(self, site_id, parent_zone_id):
         """Test creating zone with all fields."""
-        site_id = uuid4()
-        parent_id = uuid4()
         zone = ZoneCreate(
             name="Test Zone",
             site_id=site_id,
-            parent_zone_id=parent_id,
+            parent_zone_id=parent_zone_id,
             zone_type="floor",
             floor_number=2,
             area_sqft=500.5,
         )
         assert zone.name == "Test Zone"
         assert zone.site_id == site_id
-        assert zone.parent_zone_id == parent_id
+        assert zone.parent_zone_id == parent_zone_id
         assert zone.zone_type == "floor"
         assert zone.floor_number == 2
         assert zone.area_sqft == 500.5
 
-    def test_create_with_invalid_type(self):
-        """Test that invalid zone type raises error."""
-        with pytest.raises(ValueError):
-            ZoneCreate(name="Test", site_id=uuid4(), zone_type="invalid")
-
-    def test_all_valid_zone_types(self):
-        """Test all valid zone types."""
-        site_id = uuid4()
-        for zone_type in [
-            "building",
-            "floor",
-            "room",
-            "closet",
-            "outdoor",
-            "garage",
-            "other",
-        ]:
-            zone = ZoneCreate(name="Test", site_id=site_id, zone_type=zone_type)
-            assert zone.zone_type == zone_type
+    @pytest.mark.parametrize(
+        "fields,message",
+        [
+            ({"zone_type": "invalid"}, "Input should be 'building'"),
+            ({"color": "red"}, "String should match pattern"),
+        ],
+    )
+    def test_create_invalid(self, make_zone, fields, message):
+        """Test that an invalid zone type or color raises error."""
+        with pytest.raises(ValidationError, match=message):
+            make_zone(**fields)
 
-    def test_color_validation_valid(self):
-        """Test valid hex color."""
-        zone = ZoneCreate(name="Test", site_id=uuid4(), color="#FF0000")
-        assert zone.color == "#FF0000"
+    @pytest.mark.parametrize(
+        "zone_type", ["building", "floor", "room", "closet", "outdoor", "garage", "other"]
+    )
+    def test_zone_type_accepted(self, make_zone, zone_type):
+        """Test each valid zone type is accepted."""
+        zone = make_zone(zone_type=zone_type)
+        assert zone.zone_type == zone_type
 
-    def test_color_validation_invalid(self):
-        """Test that invalid color raises error."""
-        with pytest.raises(ValueError):
-            ZoneCreate(name="Test", site_id=uuid4(), color="red")
+    @settings(max_examples=50)
+    @given(color=st.from_regex(r"#[0-9A-Fa-f]{6}", fullmatch=True))
+    def test_color_validation_valid(self, make_zone, color):
+        """Test any six-digit hex color is accepted unchanged."""
+        zone = make_zone(color=color)
+        assert zone.color == color
 
 
 class TestZone:
     """Tests for Zone model."""
 
-    def test_full_zone(self):
+    def test_full_zone(self, entity_id, site_id, now):
         """Test full zone entity."""
-        now = datetime.now(timezone.utc)
         zone = Zone(
-            id=uuid4(),
+            id=entity_id,
             name="Test Zone",
             slug="test-zone",
-            site_id=uuid4(),
+            site_id=site_id,
             zone_type="room",
             is_active=True,
             sort_order=0,
@@ -0,0 +1,36 @@
+-- Migration: 006_listing_indexes
+-- Description: Composite/covering indexes for the CLI listing queries
+-- Created: 2026-10-15
+
+-- ============================================================================
+-- NETWORKS
+-- list_with_details filters on site_id + is_active; INCLUDE lets the
+-- planner answer the common columns without visiting the heap
+-- ============================================================================
+CREATE INDEX IF NOT EXISTS idx_networks_site_active
+    ON networks(site_id, is_active) INCLUDE (name, slug, network_type);
+
+-- Leading site_id column also serves plain site_id lookups
+DROP INDEX IF EXISTS idx_networks_site;
+
+-- ============================================================================
+-- ZONES
+-- list_by_site filters on site_id + is_active and orders by sort_order, name
+-- ============================================================================
+CREATE INDEX IF NOT EXISTS idx_zones_site_active_sort
+    ON zones(site_id, is_active, sort_order, name) INCLUDE (slug);
+
+-- Leading site_id column also serves plain site_id lookups
+DROP INDEX IF EXISTS idx_zones_site;
+
+-- ============================================================================
+-- IP ALLOCATIONS
+-- list_ip_allocations filters on network_id and orders by ip_address,
+-- which the index behind UNIQUE(network_id, ip_address) from 002 already
+-- covers. That index also serves plain network_id lookups, so the
+-- single-column index from 002 is redundant.
+-- ============================================================================
+DROP INDEX IF EXISTS idx_ip_allocations_network;
+
+-- Note: devices(site_id), devices(zone_id) and devices(network_id) are
+-- already indexed by 003_inventory_devices.sql.
@@ -0,0 +1,96 @@
+-- Migration: 007_site_counters
+-- Description: Denormalized zone/network/device counters on sites
+-- Created: 2026-10-15
+
+-- ============================================================================
+-- COUNTER COLUMNS
+-- Maintained by triggers so site detail views read one row instead of
+-- running a COUNT(*) subquery per child table.
+-- ============================================================================
+ALTER TABLE sites
+    ADD COLUMN IF NOT EXISTS zone_count INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS network_count INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS device_count INTEGER NOT NULL DEFAULT 0;
+
+-- ============================================================================
+-- SITES UPDATED_AT
+-- Counter maintenance is not an edit of the site, so an update that only
+-- changes counter columns keeps the existing updated_at. Replaces
+-- update_updated_at() on sites; created before the backfill below.
+-- ============================================================================
+CREATE OR REPLACE FUNCTION update_sites_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF to_jsonb(NEW) - ARRAY['zone_count', 'network_count', 'device_count', 'updated_at']
+        = to_jsonb(OLD) - ARRAY['zone_count', 'network_count', 'device_count', 'updated_at']
+    THEN
+        NEW.updated_at := OLD.updated_at;
+    ELSE
+        NEW.updated_at := NOW();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_sites_updated ON sites;
+CREATE TRIGGER trg_sites_updated
+    BEFORE UPDATE ON sites
+    FOR EACH ROW EXECUTE FUNCTION update_sites_updated_at();
+
+-- Backfill from existing data
+UPDATE sites s SET
+    zone_count = (SELECT COUNT(*) FROM zones z WHERE z.site_id = s.id),
+    network_count = (SELECT COUNT(*) FROM networks n WHERE n.site_id = s.id),
+    device_count = (SELECT COUNT(*) FROM devices d WHERE d.site_id = s.id);
+
+-- ============================================================================
+-- SYNC FUNCTION
+-- TG_ARGV[0] is the sites counter column for the child table
+-- ============================================================================
+CREATE OR REPLACE FUNCTION sync_site_counts()
+RETURNS TRIGGER AS $$
+DECLARE
+    counter TEXT := TG_ARGV[0];
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.site_id IS NOT DISTINCT FROM OLD.site_id THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        EXECUTE format('UPDATE sites SET %I = %I - 1 WHERE id = $1', counter, counter)
+            USING OLD.site_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        EXECUTE format('UPDATE sites SET %I = %I + 1 WHERE id = $1', counter, counter)
+            USING NEW.site_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- TRIGGERS
+-- ============================================================================
+DROP TRIGGER IF EXISTS trg_sites_zone_count ON zones;
+CREATE TRIGGER trg_sites_zone_count
+    AFTER INSERT OR DELETE OR UPDATE OF site_id ON zones
+    FOR EACH ROW EXECUTE FUNCTION sync_site_counts('zone_count');
+
+DROP TRIGGER IF EXISTS trg_sites_network_count ON networks;
+CREATE TRIGGER trg_sites_network_count
+    AFTER INSERT OR DELETE OR UPDATE OF site_id ON networks
+    FOR EACH ROW EXECUTE FUNCTION sync_site_counts('network_count');
+
+DROP TRIGGER IF EXISTS trg_sites_dev_count ON devices;
+CREATE TRIGGER trg_sites_dev_count
+    AFTER INSERT OR DELETE OR UPDATE OF site_id ON devices
+    FOR EACH ROW EXECUTE FUNCTION sync_site_counts('device_count');
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+COMMENT ON COLUMN sites.zone_count IS 'Number of zones in the site (trigger-maintained)';
+COMMENT ON COLUMN sites.network_count IS 'Number of networks in the site (trigger-maintained)';
+COMMENT ON COLUMN sites.device_count IS 'Number of devices in the site (trigger-maintained)';